@@ -1,35 +1,47 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import io
-import pyperclip
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 
-class SessionState:
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
+PAGES = ("Summary", "Individual Analytics")
+GMT_DATE_PATTERN = re.compile(r"GMT(\d{8})")
 
-def extract_participants_and_messages(lines):
+def extract_participants_and_messages(raw):
     """
     Extracts participants and their messages from chat data.
 
     Args:
-        lines (list): List of lines containing chat data.
+        raw (bytes): Raw content of the chat file.
 
     Returns:
         DataFrame: DataFrame containing participants and their messages.
     """
-    chat_records = []
-    for line in lines:
-        parts = line.strip().decode('utf-8').split("\t")  # Decode bytes to string
-        if len(parts) == 3:
-            chat_records.append(parts)
-
-    chat_data = pd.DataFrame(chat_records, columns=["Time", "Participant", "Message"])
-    chat_data["Participant"] = chat_data["Participant"].str.replace(":", "")
+    # Zoom chat files are tab-separated, so Arrow's CSV reader can split and decode them straight into Arrow columns
+    column_names = ["Time", "Participant", "Message"]
+    chat_table = pa_csv.read_csv(
+        # Arrow rejects a completely empty buffer, a lone newline parses to the same empty table
+        pa.py_buffer(raw or b"\n"),
+        read_options=pa_csv.ReadOptions(column_names=column_names),
+        # Messages are not quoted, and lines with a different number of fields are skipped
+        parse_options=pa_csv.ParseOptions(delimiter="\t", quote_char=False, invalid_row_handler=lambda row: "skip"),
+        convert_options=pa_csv.ConvertOptions(column_types=dict.fromkeys(column_names, pa.string())),
+    )
+    chat_data = chat_table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    # Keep only records with a non-empty message
+    chat_data["Message"] = chat_data["Message"].str.rstrip()
+    chat_data = chat_data[chat_data["Message"].str.len() > 0].reset_index(drop=True)
+    # Arrow string kernels strip the trailing colon over the whole column at once
+    chat_data["Participant"] = chat_data["Participant"].str.rstrip(":")
     return chat_data
 
+@lru_cache(maxsize=256)
 def extract_date_from_filename(filename):
     """
     Extracts the date from the file name after 'GMT'.
@@ -40,78 +52,339 @@ def extract_date_from_filename(filename):
     Returns:
         str: The extracted date.
     """
-    date_match = re.search(r"GMT(\d{8})", filename) 
+    date_match = GMT_DATE_PATTERN.search(filename)
     if date_match:
         return date_match.group(1)
     else:
         return "Unknown Date"
     
-def process_uploaded_files(uploaded_files):
+@lru_cache(maxsize=256)
+def format_meeting_date(filename):
+    """
+    Formats the meeting date in the file name for display.
+
+    Args:
+        filename (str): The name of the file.
+
+    Returns:
+        str: The meeting date, e.g. "Tuesday, 13 August 2024".
+    """
+    # Convert the meeting date string to a datetime object
+    meeting_date = datetime.strptime(extract_date_from_filename(filename), "%Y%m%d")
+    # Format the meeting date as desired
+    return meeting_date.strftime("%A, %d %B %Y")
+
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def process_uploaded_files(files):
+    """
+    Processes uploaded chat files into per-day participant data.
+
+    Args:
+        files (tuple): Tuple of (file name, file content bytes) pairs.
+
+    Returns:
+        tuple: List of per-day participant DataFrames, list of per-day chat DataFrames,
+            and a dict mapping day labels to formatted meeting dates.
+    """
     # Initialize an empty list to store participant data
     participant_data = []
     meeting_dates = {}
 
-    sorted_files = sorted(uploaded_files, key=lambda x: extract_date_from_filename(x.name))
-    chats_data = []
+    sorted_files = sorted(files, key=lambda x: extract_date_from_filename(x[0]))
+    # Every day shares one category dtype, so the per-day frames concatenate into a categorical Day column
+    day_dtype = pd.CategoricalDtype([f"Day {file_index}" for file_index in range(1, len(sorted_files) + 1)])
+
+    # Parse the files in parallel, pyarrow's CSV reader releases the GIL while parsing
+    if len(sorted_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(sorted_files))) as executor:
+            chats_data = list(executor.map(extract_participants_and_messages, (raw for _, raw in sorted_files)))
+    else:
+        # A single file gains nothing from a pool, so skip starting one
+        chats_data = [extract_participants_and_messages(raw) for _, raw in sorted_files]
 
-    for file_index, file in enumerate(sorted_files, start=1):
+    for file_index, ((file_name, _), chat_data) in enumerate(zip(sorted_files, chats_data), start=1):
         # Use file name for meeting name
-        meeting_date = extract_date_from_filename(file.name)
-        # Convert the meeting date string to a datetime object
-        meeting_date = datetime.strptime(meeting_date, "%Y%m%d")
-        # Format the meeting date as desired
-        formatted_date = meeting_date.strftime("%A, %d %B %Y")
-        meeting_dates[f"Day {file_index}"] = formatted_date
+        meeting_dates[f"Day {file_index}"] = format_meeting_date(file_name)
 
         day = f"Day {file_index}"
 
-        # Extract chat data
-        chat_data = extract_participants_and_messages(file.readlines())
-        chats_data.append(chat_data)
-
-        # Group participants by name and count messages
-        message_count = chat_data.groupby("Participant").size().reset_index(name="Message Count")
-
         # Split messages into reactions and regular messages
         chat_data['Is Reaction'] = chat_data['Message'].str.startswith('Reacted')
-        reaction_count = chat_data[chat_data['Is Reaction']].groupby('Participant').size().reset_index(name='Reaction Count')
-        chat_count = chat_data[~chat_data['Is Reaction']].groupby('Participant').size().reset_index(name='Chat Count')
 
-        # Merge reaction and chat counts
-        participant_data_day = pd.merge(message_count, reaction_count, on='Participant', how='left').fillna(0)
-        participant_data_day = pd.merge(participant_data_day, chat_count, on='Participant', how='left').fillna(0)
-        
-        participant_data_day['Reaction Count'] = participant_data_day['Reaction Count'].astype(int)
-        participant_data_day['Chat Count'] = participant_data_day['Chat Count'].astype(int)
+        # Count messages and reactions per participant by accumulating over integer name codes
+        codes, participants = pd.factorize(chat_data["Participant"], sort=True)
+        message_count = np.bincount(codes, minlength=len(participants))
+        reaction_count = np.bincount(
+            codes, weights=chat_data["Is Reaction"].to_numpy(dtype=bool), minlength=len(participants)
+        ).astype(int)
+        participant_data_day = pd.DataFrame({
+            "Participant": participants,
+            "Message Count": message_count,
+            "Reaction Count": reaction_count,
+            "Chat Count": message_count - reaction_count,
+        })
+        # Counts are small and never negative, so store them in the smallest unsigned dtype
+        count_columns = ["Message Count", "Reaction Count", "Chat Count"]
+        participant_data_day[count_columns] = participant_data_day[count_columns].apply(pd.to_numeric, downcast="unsigned")
 
         # Determine attendance and activity level for each participant
-        participant_data_day["Attendance"] = "1"
-        participant_data_day.loc[participant_data_day["Message Count"] == 0, "Attendance"] = "0"
+        participant_data_day["Attendance"] = participant_data_day["Message Count"] > 0
         participant_data_day["Activity Level"] = "pasif"
         
         # Add day information
-        participant_data_day["Day"] = day
+        participant_data_day["Day"] = pd.Categorical([day] * len(participant_data_day), dtype=day_dtype)
         
         # Append participant data to list
         participant_data.append(participant_data_day)
 
     return participant_data, chats_data, meeting_dates
 
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def compute_summary(participant_data_raw):
+    """
+    Sums the per-day participant counts over all days.
+
+    Args:
+        participant_data_raw (list): List of per-day participant DataFrames.
+
+    Returns:
+        DataFrame: Message, reaction and chat counts and the number of days attended,
+            indexed by participant name.
+    """
+    # Only the names and counts are aggregated, so join those columns rather than whole per-day frames
+    participant_names = pd.concat([data["Participant"] for data in participant_data_raw], ignore_index=True)
+    # Sum every count per participant in one pass over integer name codes
+    codes, participants = pd.factorize(participant_names, sort=True)
+    participant_data_grouped = pd.DataFrame({
+        column: np.bincount(
+            codes,
+            weights=np.concatenate([data[column].to_numpy() for data in participant_data_raw]),
+            minlength=len(participants)
+        )
+        for column in ["Message Count", "Reaction Count", "Chat Count"]
+    }, index=pd.Index(participants, name="Participant"))
+    # Attendance is the number of days a participant shows up in
+    participant_data_grouped["Attendance"] = np.bincount(codes, minlength=len(participants))
+    participant_data_grouped = participant_data_grouped.astype(int).apply(pd.to_numeric, downcast="unsigned")
+
+    return participant_data_grouped
+
+def select_participants(participant_data, n, ascending=False):
+    """
+    Selects the participants with the most or the fewest messages.
+
+    Only the rows up to the n-th count are sorted; the rest are split off with
+    a partial partition. Ties keep the participant name order of the index.
+
+    Args:
+        participant_data (DataFrame): Per-participant counts indexed by participant name.
+        n (int): Number of participants to select.
+        ascending (bool): Select the participants with the fewest messages instead.
+
+    Returns:
+        DataFrame: The selected participants, ordered by message count.
+    """
+    message_counts = participant_data["Message Count"].to_numpy().astype(np.int64)
+    if not ascending:
+        message_counts = -message_counts
+
+    selected = np.arange(len(message_counts))
+    if len(message_counts) > n:
+        # Keep every row tied with the n-th count, so the stable sort below breaks ties by name
+        cutoff = np.partition(message_counts, n - 1)[n - 1]
+        selected = np.flatnonzero(message_counts <= cutoff)
+    selected = selected[np.argsort(message_counts[selected], kind="stable")][:n]
+    return participant_data.iloc[selected].reset_index()
+
+def load_uploaded_files(uploaded_files):
+    """
+    Loads the processed chat data for the uploaded files.
+
+    The result is kept in the session state along with the ids of the
+    uploads, so reruns and page switches that keep the same uploads do not
+    even re-read and re-hash the file contents.
+
+    Args:
+        uploaded_files (list): List of uploaded chat files.
+
+    Returns:
+        tuple: The result of process_uploaded_files for the uploaded files.
+    """
+    # Every upload gets a fresh id, so a re-uploaded file with the same name and size is still picked up
+    files_signature = tuple(file.id for file in uploaded_files)
+    if st.session_state.get("files_signature") != files_signature:
+        st.session_state["chat_data"] = process_uploaded_files(
+            tuple((file.name, file.getvalue()) for file in uploaded_files)
+        )
+        st.session_state["files_signature"] = files_signature
+    return st.session_state["chat_data"]
+
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def process_chat_notes(participant_data_raw, meeting_dates):
+    """
+    Builds the attendance and activity notes for each participant.
+
+    Args:
+        participant_data_raw (list): List of per-day participant DataFrames.
+        meeting_dates (dict): Mapping of day labels to formatted meeting dates.
+
+    Returns:
+        tuple: DataFrame of participant notes, the mean chat count and the mean reaction count.
+    """
+    # Concatenate participant data for all days
+    participant_data_df = pd.concat(participant_data_raw, ignore_index=True)
+    participant_data_df["Participant"] = participant_data_df["Participant"].astype("category")
+
+    # Define mean_chat_count_day and mean_reaction_count_day for criteria
+    mean_chat_count_day = int(participant_data_df["Chat Count"].mean())
+    mean_reaction_count_day = int(participant_data_df["Reaction Count"].mean())
+
+    # Convert meeting_dates to a list of dates in order
+    dates = list(meeting_dates.keys())
+
+    # Count each participant's rows per day in one pass, every participant who appears on any day gets a full row
+    day_counts = pd.crosstab(participant_data_df["Participant"], participant_data_df["Day"]).reindex(columns=dates, fill_value=0)
+    participant_attendance = pd.DataFrame(np.where(day_counts > 0, "✅", "❌"), index=day_counts.index, columns=dates)
+
+    # Spread the counts into one column per day, participants missing from a day count zero
+    wide_counts = participant_data_df.pivot_table(
+        index="Participant",
+        columns="Day",
+        values=["Message Count", "Reaction Count"],
+        aggfunc="sum",
+        fill_value=0,
+        observed=True,
+    )
+    message_counts = wide_counts["Message Count"].reindex(index=participant_attendance.index, columns=dates, fill_value=0).astype(int)
+    reaction_counts = wide_counts["Reaction Count"].reindex(index=participant_attendance.index, columns=dates, fill_value=0).astype(int)
+
+    # Build the notes one day at a time, each step works on every participant at once
+    attendance_notes = None
+    activity_notes = None
+    for date in dates:
+        message_count = message_counts[date]
+        reaction_count = reaction_counts[date]
+
+        # Check message count criteria
+        activity = pd.Series(np.select(
+            [message_count >= mean_chat_count_day, message_count >= 3],
+            ["sangat aktif chat", "kurang aktif chat"],
+            default="pasif"
+        ), index=message_count.index)
+
+        # Check reaction count criteria
+        responsiveness = pd.Series(np.select(
+            [reaction_count >= mean_reaction_count_day, (reaction_count >= 1) & (reaction_count < mean_chat_count_day)],
+            ["responsif konfirmasi, " + reaction_count.astype(str) + " kali react", "kurang responsif"],
+            default="tidak responsif"
+        ), index=reaction_count.index)
+
+        day_notes = (f"{date}: " + activity + " (" + message_count.astype(str) + ") & " + responsiveness).where(
+            day_counts[date] > 0, f"{date}: tidak hadir atau tidak chat/react sama sekali"
+        )
+        day_attendance = f"{date}: " + participant_attendance[date]
+
+        if activity_notes is None:
+            attendance_notes, activity_notes = day_attendance, day_notes
+        else:
+            attendance_notes = attendance_notes + " | " + day_attendance
+            activity_notes = activity_notes + " \n- " + day_notes
+
+    # Overall notes for each participant
+    participant_notes_df = pd.DataFrame({
+        "Name": participant_attendance.index.tolist(),
+        "Notes": ("Kehadiran\n" + attendance_notes + "\n\nNotes: \n- " + activity_notes).tolist()
+    })
+
+    return participant_notes_df, mean_chat_count_day, mean_reaction_count_day
+
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def encode_csv(data):
+    """
+    Encodes a DataFrame as CSV bytes for a download button.
+
+    Args:
+        data (DataFrame): The DataFrame to encode.
+
+    Returns:
+        bytes: The CSV content, without the index.
+    """
+    # Write the CSV straight into a bytes buffer rather than building a str and encoding a copy of it
+    buffer = io.BytesIO()
+    data.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def encode_parquet(data):
+    """
+    Encodes a DataFrame as zstd-compressed Parquet bytes for a download button.
+
+    Args:
+        data (DataFrame): The DataFrame to encode.
+
+    Returns:
+        bytes: The Parquet content, without the index.
+    """
+    buffer = io.BytesIO()
+    data.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, ttl="1h", max_entries=8)
+def build_barh(participants, title, color=None):
+    """
+    Renders a horizontal bar chart of message counts per participant.
+
+    Args:
+        participants (DataFrame): Participants and their message counts, in plotting order.
+        title (str): The chart title.
+        color (str, optional): The bar color. Defaults to matplotlib's default color.
+
+    Returns:
+        bytes: The bar chart as a PNG image.
+    """
+    # matplotlib is only needed once there is something to plot, so keep it out of the app's cold start
+    from matplotlib.figure import Figure
+
+    # Figures are created outside pyplot so its global figure manager never holds on to them
+    fig = Figure(figsize=(10, 4), layout="constrained")
+    ax = fig.subplots()
+    bars = ax.barh(participants["Participant"], participants["Message Count"], color=color)
+    ax.set_xlabel("Number of Messages")
+    ax.set_ylabel("Participant")
+    ax.set_title(title)
+    ax.bar_label(bars, fmt='%.0f', padding=3, fontsize=10)
+
+    # A lower DPI than st.pyplot's default of 200 keeps the PNG sent to the browser small
+    image = io.BytesIO()
+    fig.savefig(image, format="png", dpi=80, bbox_inches="tight")
+    return image.getvalue()
+
+def render_sidebar_uploads():
+    """
+    Renders the chat file upload widgets in the sidebar.
+
+    Returns:
+        list: List of uploaded chat files.
+    """
+    st.sidebar.header("🗃️ Upload Chat Files")
+    st.sidebar.write("You can upload multiple files (e.g., Zoom Chat from Day 1 to Day 4)")
+    uploaded_files = st.sidebar.file_uploader("Choose files", type=['txt'], accept_multiple_files=True)
+    st.sidebar.markdown("⚠️ Make sure your filename is the original name of the downloaded Zoom chat. **Do not rename it**. It must contain `GMTYYYYMMDD` at least.")
+    return uploaded_files
+
 def main():
     st.title("💭 Zoom Chat Analyzer - Algoritma")
     st.write("""
     📊 This app analyzes chat data and provides insights into the most active and silent participants.
     """)
 
-    # Initialize session state
-    state = SessionState(page="Summary", participant_data=None)
+    # Page selection, the widget key keeps the selected page in the session state across reruns
+    page = st.sidebar.radio("📍 Select Page", PAGES, key="page")
 
-    # Page selection
-    page = st.sidebar.radio("📍 Select Page", ["Summary", "Individual Analytics"], index=["Summary", "Individual Analytics"].index(state.page))
+    # Both pages read the same uploads, so the uploader is rendered once and keeps its files across pages
+    uploaded_files = render_sidebar_uploads()
 
     if page == "Summary":
-        state.page = "Summary"
-
         st.markdown("---")
         st.header("📃 Summary Page")
 
@@ -119,188 +392,87 @@ def main():
         course_name = st.sidebar.text_input("👩🏻‍🏫 Course Name", "Batch - Course Name")
         day = st.sidebar.text_input("✨ Day", "Overall Day")
 
-        # Upload chat files
-        st.sidebar.header("🗃️ Upload Chat Files")
-        st.sidebar.write("You can upload multiple files (e.g., Zoom Chat from Day 1 to Day 4)")
-        uploaded_files = st.sidebar.file_uploader("Choose files", type=['txt'], accept_multiple_files=True)
-        st.sidebar.markdown("⚠️ Make sure your filename is the original name of the downloaded Zoom chat. **Do not rename it**. It must contain `GMTYYYYMMDD` at least.")
-
         if uploaded_files:
-            # Concatenate participant data for all days
-            participant_data_raw, chats_data, meeting_dates = process_uploaded_files(uploaded_files=uploaded_files)
-            participant_data_df = pd.concat(participant_data_raw)
-            participant_data_grouped = participant_data_df.groupby('Participant').agg({
-                'Message Count': 'sum',
-                'Reaction Count': 'sum',
-                'Chat Count': 'sum',
-                'Attendance': 'count'
-            })
+            participant_data_raw, chats_data, meeting_dates = load_uploaded_files(uploaded_files)
+            # Sum participant data for all days
+            participant_data_grouped = compute_summary(participant_data_raw)
 
             # Most active participants plot
             st.subheader("Top 10 Most Active Participants")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            most_active_participants = participant_data_grouped.sort_values("Message Count", ascending=False).head(10)
-            most_active_participants = most_active_participants.sort_values("Message Count", ascending=True).reset_index() 
-            bars = ax.barh(most_active_participants["Participant"], most_active_participants["Message Count"])
-            ax.set_xlabel("Number of Messages")
-            ax.set_ylabel("Participant")
-            ax.set_title(f"Top 10 Most Active Participants - {course_name}")
-            for bar in bars:
-                ax.text(bar.get_width(), bar.get_y() + bar.get_height()/2, f'{bar.get_width():.0f}', 
-                        va='center', ha='left', fontsize=10)
-            st.pyplot(fig)
-
-            # Print top 10 most active participants
-            st.write(", ".join(f'{participant}' for participant in most_active_participants.sort_values("Message Count", ascending=False)["Participant"].tolist()))
+            # Reverse the selection so the largest bar ends up on top
+            most_active_participants = select_participants(participant_data_grouped, 10)
+            st.image(build_barh(
+                most_active_participants.iloc[::-1],
+                f"Top 10 Most Active Participants - {course_name}"
+            ), use_column_width=True)
+
+            # Print top 10 most active participants, the code block gives users a copy button
+            st.code(", ".join(f'{participant}' for participant in most_active_participants["Participant"].tolist()), language=None)
 
             # Most silent participants plot
             st.subheader("Top 10 Most Silent Participants")
-            fig2, ax2 = plt.subplots(figsize=(10, 6))
-            most_silent_participants = participant_data_grouped.sort_values("Message Count", ascending=True).head(10)
-            most_silent_participants = most_silent_participants.sort_values("Message Count", ascending=False).reset_index()
-            bars2 = ax2.barh(most_silent_participants["Participant"], most_silent_participants["Message Count"], color='orange')
-            ax2.set_xlabel("Number of Messages")
-            ax2.set_ylabel("Participant")
-            ax2.set_title(f"Top 10 Most Silent Participants - {course_name} {day}")
-            for bar in bars2:
-                ax2.text(bar.get_width(), bar.get_y() + bar.get_height()/2, f'{bar.get_width():.0f}', 
-                         va='center', ha='left', fontsize=10)
-            st.pyplot(fig2)
+            most_silent_participants = select_participants(participant_data_grouped, 10, ascending=True)
+            st.image(build_barh(
+                most_silent_participants.iloc[::-1],
+                f"Top 10 Most Silent Participants - {course_name} {day}",
+                color='orange'
+            ), use_column_width=True)
 
             # Print top 10 most silent participants
-            st.write(", ".join(f'{participant}' for participant in most_silent_participants.sort_values("Message Count", ascending=True)["Participant"].tolist()))
+            st.code(", ".join(f'{participant}' for participant in most_silent_participants["Participant"].tolist()), language=None)
 
             st.subheader("Participant Activity Sorted by Number of Messages")
             sorted_participant_data = participant_data_grouped.sort_values("Message Count", ascending=False).reset_index()
-            st.write(sorted_participant_data)
+            st.dataframe(sorted_participant_data, use_container_width=True, hide_index=True)
 
             st.markdown("---")
             
-            chats_data = pd.concat(chats_data)
+            chats_data = pd.concat(chats_data, ignore_index=True)
             # Print DataFrames
             st.subheader("Chat Data Summary")
-            st.write(chats_data)
-
-            # Download CSV button
-            csv_data = chats_data.to_csv(index=False)
-            df_bytes = io.BytesIO(csv_data.encode())
-            st.download_button(
-                label="Download Chat Summary CSV",
-                data=df_bytes,
-                file_name="chat_summary.csv",
-                mime="text/csv"
-            )
+            st.dataframe(chats_data, use_container_width=True, hide_index=True)
+
+            # Download button, Parquet is much smaller than CSV for long chats
+            download_format = st.radio("Download format", ["CSV", "Parquet"], horizontal=True)
+            if download_format == "Parquet":
+                st.download_button(
+                    label="Download Chat Summary Parquet",
+                    data=encode_parquet(chats_data),
+                    file_name="chat_summary.parquet",
+                    mime="application/octet-stream"
+                )
+            else:
+                st.download_button(
+                    label="Download Chat Summary CSV",
+                    data=encode_csv(chats_data),
+                    file_name="chat_summary.csv",
+                    mime="text/csv"
+                )
 
 
     elif page == "Individual Analytics":
-        state.page = "Individual Analytics"
-
         st.markdown("---")
         st.header("🫂 Individual Analytics Page")
-        # Upload files
-        st.sidebar.header("🗃️ Upload Chat Files")
-        st.sidebar.write("You can upload multiple files (e.g., Zoom Chat from Day 1 to Day 4)")
-        uploaded_files = st.sidebar.file_uploader("Choose files", type=['txt'], accept_multiple_files=True)
 
         if uploaded_files:
             # Initialize an empty list to store participant data
-            participant_data_raw, combine, meeting_dates = process_uploaded_files(uploaded_files=uploaded_files)
-
-            # Concatenate participant data for all days
-            participant_data_df = pd.concat(participant_data_raw)
-
-            # Iterate over unique dates
-            for key, value in meeting_dates.items():
-                st.write(f"{key}: {value}")
-
-            # Define mean_chat_count_day and mean_reaction_count_day for criteria
-            mean_chat_count_day = int(participant_data_df["Chat Count"].mean())
-            mean_reaction_count_day = int(participant_data_df["Reaction Count"].mean())
-
-            # Convert meeting_dates to a list of dates in order
-            dates = list(meeting_dates.keys())
-
-            # Initialize participant attendance dictionary with all participants starting from Day 1
-            participants = set(participant_data_df["Participant"])
-            participant_attendance = {participant: ["❌"] * len(dates) for participant in participants}
-
-            # Loop through each participant to determine attendance for each day
-            for participant in participants:
-                for date in dates:
-                    if date in participant_data_df.loc[participant_data_df["Participant"] == participant, "Day"].values:
-                        day_index = dates.index(date)
-                        participant_attendance[participant][day_index] = "✅"
-
-            # Update the participant list if a new participant appears in later dates
-            for date in dates:
-                new_participants = participant_data_df.loc[participant_data_df["Day"] == date, "Participant"].unique()
-                for new_participant in new_participants:
-                    if new_participant not in participant_attendance:
-                        participant_attendance[new_participant] = ["❌"] * dates.index(date) + ["✅"] + ["❌"] * (len(meeting_dates) - meeting_dates.index(date) - 1)
-
-            # Create participant notes based on message count, reaction count, and attendance criteria
-            participant_notes = []
-            for participant, participant_data in participant_data_df.groupby("Participant"):
-                attendance_notes = []
-                activity_notes = []
-
-                for date, attendance in zip(dates, participant_attendance[participant]):
-                    # Check attendance
-                    attendance_notes.append(f"{date}: {attendance}")
-
-                    # Check message count criteria
-                    day_data = participant_data[participant_data["Day"] == date]
-                    if not day_data.empty:
-                        message_count = day_data["Message Count"].values[0]
-                        reaction_count = day_data["Reaction Count"].values[0]
-
-                        if message_count >= mean_chat_count_day:
-                            activity_notes.append(f"{date}: sangat aktif chat ({message_count})")
-                        elif 3 <= message_count < mean_chat_count_day:
-                            activity_notes.append(f"{date}: kurang aktif chat ({message_count})")
-                        else:
-                            activity_notes.append(f"{date}: pasif ({message_count})")
-
-                        # Check reaction count criteria
-                        if reaction_count >= mean_reaction_count_day:
-                            responsiveness = f"responsif konfirmasi, {reaction_count} kali react"
-                        elif 1 <= reaction_count < mean_chat_count_day:
-                            responsiveness = "kurang responsif"
-                        else:
-                            responsiveness = "tidak responsif"
-
-                        activity_notes[-1] += f" & {responsiveness}"
-                    else:
-                        activity_notes.append(f"{date}: tidak hadir atau tidak chat/react sama sekali")
-
-                    if date != dates[-1]:
-                        activity_notes.append("\n-")
-
-                # Combine attendance and activity notes
-                attendance_notes_str = " | ".join(attendance_notes)
-                activity_notes_str = " ".join(activity_notes)
-
-                # Overall notes for the participant
-                overall_notes = f"Kehadiran\n{attendance_notes_str}\n\nNotes: \n- {activity_notes_str}"
-
-                participant_notes.append({
-                    "Name": participant,
-                    "Notes": overall_notes
-                })
-
-            # Create DataFrame for participant notes
-            participant_notes_df = pd.DataFrame(participant_notes)
+            participant_data_raw, combine, meeting_dates = load_uploaded_files(uploaded_files)
+
+            # List every meeting date in one block instead of one element per date
+            st.markdown("\n".join(f"- **{key}**: {value}" for key, value in meeting_dates.items()))
+
+            participant_notes_df, mean_chat_count_day, mean_reaction_count_day = process_chat_notes(
+                participant_data_raw, meeting_dates
+            )
 
             # Display participant notes in a table format
             st.subheader("Participant Notes")
-            st.write(participant_notes_df)
+            st.dataframe(participant_notes_df, use_container_width=True, hide_index=True)
 
             # Download CSV button
-            csv_data = participant_notes_df.to_csv(index=False)
-            df_bytes = io.BytesIO(csv_data.encode())
             st.download_button(
                 label="Download Summary CSV",
-                data=df_bytes,
+                data=encode_csv(participant_notes_df),
                 file_name="participant_notes.csv",
                 mime="text/csv"
             )